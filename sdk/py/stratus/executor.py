@@ -4,23 +4,24 @@ Query executor
 Handles prepared statement execution with both positional and named parameters.
 """
 
+import warnings
 from typing import TypeVar, Generic, Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 
 from .pool import StratusPool, PoolConnection
-from .types import QueryResult, SingleResult, ExecuteOptions
+from .types import _SLOTS, QueryResult, SingleResult, ExecuteOptions
 from .params import (
-    detect_param_style,
-    parse_named_params,
+    _parse_sql_cached,
     validate_param_count,
     prepare_params,
+    prepare_params_positional,
 )
 
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class QueryInfo:
     """Query metadata"""
 
@@ -138,6 +139,7 @@ class StratusExecutor:
         params: Union[List[Any], Dict[str, Any]],
         *,
         return_type: str = "many",
+        param_style: Optional[str] = None,
         options: Optional[ExecuteOptions] = None,
     ) -> QueryResult:
         """
@@ -147,23 +149,36 @@ class StratusExecutor:
             sql: SQL query
             params: Parameters (positional list or named dict)
             return_type: 'one', 'many', or 'exec'
+            param_style: Optional hint ('positional' or 'named'). Callers
+                that know the style (e.g. generated code) can pass
+                'positional' to skip SQL parsing entirely.
             options: Execution options
 
         Returns:
             Query result
         """
-        param_style = detect_param_style(sql)
-        param_array = prepare_params(sql, params)
-
-        if param_style[0] != "unknown" and param_style[2] > 0:
-            validate_param_count(sql, param_array, param_style[2])
+        if param_style == "positional":
+            # Hinted hot path: no regex, no cache lookup
+            exec_sql = sql
+            param_array = prepare_params_positional(params)
+        else:
+            # Single cached parse: style detection, named-param ordering
+            # and the named -> positional rewrite all come from one
+            # descriptor, handed to prepare_params to avoid a second
+            # lookup.
+            info = _parse_sql_cached(sql)
+            param_count = info.count
+            exec_sql, param_array = prepare_params(sql, params, info)
+
+            # Cheap length compare first; the helper only runs to raise
+            if param_count > 0 and len(param_array) != param_count:
+                validate_param_count(sql, param_array, param_count)
 
         async with self.pool.connect() as conn:
-            result = await conn.execute(sql, param_array)
-
-            if return_type == "one" and result.row_count > 1:
-                import warnings
+            result = await conn.execute(exec_sql, param_array, return_type=return_type)
 
+            # Advisory check only; python -O strips the whole branch
+            if __debug__ and return_type == "one" and result.row_count > 1:
                 warnings.warn(
                     f"Query returned {result.row_count} rows but expected 1. "
                     f"Use return_type='many' for multiple rows."
@@ -176,6 +191,7 @@ class StratusExecutor:
         sql: str,
         params: Union[List[Any], Dict[str, Any]],
         *,
+        param_style: Optional[str] = None,
         options: Optional[ExecuteOptions] = None,
     ) -> SingleResult:
         """
@@ -184,6 +200,7 @@ class StratusExecutor:
         Args:
             sql: SQL query
             params: Parameters
+            param_style: Optional style hint (see query())
             options: Execution options
 
         Returns:
@@ -193,6 +210,7 @@ class StratusExecutor:
             sql=sql,
             params=params,
             return_type="one",
+            param_style=param_style,
             options=options,
         )
 
@@ -226,6 +244,51 @@ class StratusExecutor:
             options=options,
         )
 
+    async def query_many(
+        self,
+        sql: str,
+        params_list: List[Union[List[Any], Dict[str, Any]]],
+        *,
+        return_type: str = "exec",
+        options: Optional[ExecuteOptions] = None,
+    ) -> QueryResult:
+        """
+        Execute one SQL template with many parameter sets in a single batch
+
+        Batching amortizes the network round-trip over the whole batch
+        instead of paying it once per statement.
+
+        Args:
+            sql: SQL query (same template for every parameter set)
+            params_list: List of parameter sets (positional lists or named dicts)
+            return_type: 'exec' (no rows, default) or 'many'
+            options: Execution options
+
+        Returns:
+            Query result (rows populated only for return_type='many')
+        """
+        info = _parse_sql_cached(sql)
+        param_count = info.count
+
+        # rewritten_sql already equals sql for positional/unknown styles,
+        # and the driver parses the template even for an empty batch
+        exec_sql = info.rewritten_sql
+        prepared: List[List[Any]] = []
+        for params in params_list:
+            _, values = prepare_params(sql, params, info)
+            if param_count > 0 and len(values) != param_count:
+                validate_param_count(sql, values, param_count)
+            prepared.append(values)
+
+        async with self.pool.connect() as conn:
+            if return_type == "many":
+                rows = await conn.fetchmany(exec_sql, prepared)
+                return QueryResult(rows=rows, row_count=len(rows), command="SELECT")
+
+            await conn.execute_many(exec_sql, prepared)
+            command = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+            return QueryResult(rows=[], row_count=len(prepared), command=command)
+
     async def query_with_connection(
         self,
         sql: str,
@@ -246,7 +309,6 @@ class StratusExecutor:
         Returns:
             Query result
         """
-        param_style = detect_param_style(sql)
-        param_array = prepare_params(sql, params)
+        exec_sql, param_array = prepare_params(sql, params)
 
-        return await conn.execute(sql, param_array)
+        return await conn.execute(exec_sql, param_array, return_type=return_type)
@@ -5,12 +5,108 @@ Handles both positional ($1, $2, ...) and named (:id, :name) parameters.
 Positional is the default for maximum performance.
 """
 
+import datetime
+import decimal
 import re
-from typing import Dict, List, Any, Tuple, Literal
+import uuid
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple, Literal
 
 
 ParamStyle = Literal["positional", "named", "unknown"]
 
+# Types that pass through to the driver untouched. Exact-type membership
+# (type(p) in ...) is cheaper than isinstance for this dispatch and
+# covers the overwhelmingly common scalar-only parameter lists.
+_SCALAR_TYPES = frozenset(
+    {
+        int,
+        float,
+        str,
+        bool,
+        bytes,
+        type(None),
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        uuid.UUID,
+        decimal.Decimal,
+    }
+)
+
+# Matches both parameter styles in one alternation: group 1 is a
+# positional index ($1, $2, ...), group 2 is a named parameter (:id).
+_PARAM_RE = re.compile(r"\$(\d+)|:([A-Za-z_]\w*)")
+
+
+class ParsedSQL(NamedTuple):
+    """Immutable cached parse descriptor for one SQL template
+
+    Every container is frozen (tuples/str), so cached descriptors are
+    shared between callers without defensive copies.
+    """
+
+    style: ParamStyle
+    names: Tuple[str, ...]
+    count: int
+    order: Tuple[str, ...]
+    rewritten_sql: str
+
+
+@lru_cache(maxsize=1024)
+def _parse_sql_cached(sql: str) -> ParsedSQL:
+    """
+    Parse SQL parameters once and cache the result
+
+    Production workloads reuse a small set of SQL templates, so the regex
+    scan only runs the first time a given query string is seen. Both
+    parameter styles are collected in a single pass over the SQL. For
+    named style the SQL is also rewritten to positional $N placeholders,
+    so the text sent to the server is stable and the driver can reuse
+    server-side plans. lru_cache is thread-safe, so no extra locking is
+    needed.
+
+    Args:
+        sql: SQL query with parameters
+
+    Returns:
+        ParsedSQL descriptor
+    """
+    max_param = 0
+    positional: List[int] = []
+    # Set sidecar for O(1) dedup; the list keeps appearance order
+    seen: set = set()
+    named: List[str] = []
+
+    for match in _PARAM_RE.finditer(sql):
+        index = match.group(1)
+        if index is not None:
+            position = int(index)
+            if position > max_param:
+                max_param = position
+            positional.append(position)
+        else:
+            name = match.group(2)
+            if name not in seen:
+                seen.add(name)
+                named.append(name)
+
+    # Positional parameters ($1, $2, etc.) take precedence. The $N
+    # display tokens are only formatted here, once per template, not
+    # per match inside the scan loop.
+    if positional:
+        return ParsedSQL(
+            "positional", tuple(f"${p}" for p in positional), max_param, (), sql
+        )
+
+    if named:
+        unique_names = tuple(named)
+        index = {name: i + 1 for i, name in enumerate(unique_names)}
+        rewritten = _PARAM_RE.sub(lambda m: f"${index[m.group(2)]}", sql)
+        return ParsedSQL("named", unique_names, len(unique_names), unique_names, rewritten)
+
+    return ParsedSQL("unknown", (), 0, (), sql)
+
 
 def detect_param_style(sql: str) -> Tuple[ParamStyle, List[str], int]:
     """
@@ -22,21 +118,8 @@ def detect_param_style(sql: str) -> Tuple[ParamStyle, List[str], int]:
     Returns:
         Tuple of (style, param_names, param_count)
     """
-    # Check for positional parameters ($1, $2, etc.)
-    positional_match = re.findall(r"\$(\d+)", sql)
-    if positional_match:
-        max_param = max(int(p) for p in positional_match)
-        return ("positional", [f"${p}" for p in positional_match], max_param)
-
-    # Check for named parameters (:id, :name, etc.)
-    named_match = re.findall(r":([a-zA-Z_][a-zA-Z0-9_]*)", sql)
-    if named_match:
-        unique_names = list(
-            dict.fromkeys(named_match)
-        )  # Preserve order, remove duplicates
-        return ("named", unique_names, len(unique_names))
-
-    return ("unknown", [], 0)
+    info = _parse_sql_cached(sql)
+    return (info.style, list(info.names), info.count)
 
 
 def parse_named_params(sql: str, params: Dict[str, Any]) -> List[Any]:
@@ -55,22 +138,26 @@ def parse_named_params(sql: str, params: Dict[str, Any]) -> List[Any]:
     Raises:
         ValueError: If a required parameter is missing
     """
-    param_order: List[str] = []
+    return _named_values(_parse_sql_cached(sql).order, params)
 
-    # Find all named parameters in order of appearance
-    for match in re.finditer(r":([a-zA-Z_][a-zA-Z0-9_]*)", sql):
-        name = match.group(1)
-        if name not in param_order:
-            param_order.append(name)
 
-    # Build array in the order parameters appear in SQL
-    result = []
-    for name in param_order:
-        if name not in params:
-            raise ValueError(f"Missing parameter :{name}")
-        result.append(_to_pg_value(params[name]))
+def _named_values(order: Tuple[str, ...], params: Dict[str, Any]) -> List[Any]:
+    """Build the positional value list for a cached named-param order
 
-    return result
+    map + __getitem__ builds the list in C; values only get a Python-level
+    conversion pass when a container type is present.
+
+    Raises:
+        ValueError: If a required parameter is missing
+    """
+    try:
+        values = list(map(params.__getitem__, order))
+    except KeyError as missing:
+        raise ValueError(f"Missing parameter :{missing.args[0]}") from None
+
+    if all(type(v) in _SCALAR_TYPES for v in values):
+        return values
+    return [_to_pg_value(v) for v in values]
 
 
 def validate_param_count(sql: str, params: List[Any], expected_count: int) -> None:
@@ -85,7 +172,9 @@ def validate_param_count(sql: str, params: List[Any], expected_count: int) -> No
     Raises:
         ValueError: If count doesn't match
     """
-    actual_count = len([p for p in params if p is not None])
+    # Plain length compare: None is a legitimate parameter value (NULL)
+    # and must count, and filtering allocated a list per call.
+    actual_count = len(params)
 
     if actual_count != expected_count:
         raise ValueError(
@@ -110,33 +199,70 @@ def _to_pg_value(value: Any) -> Any:
     return value
 
 
-def prepare_params(sql: str, params: Any) -> List[Any]:
+def prepare_params(
+    sql: str,
+    params: Any,
+    style_info: Optional[ParsedSQL] = None,
+) -> Tuple[str, List[Any]]:
     """
-    Prepare parameters for query execution
+    Prepare SQL and parameters for query execution
+
+    Named parameters are rewritten to positional $N placeholders (cached
+    per SQL template), since that is the form the driver executes.
 
     Args:
         sql: SQL query
         params: Parameters (positional list or named dict)
+        style_info: Precomputed descriptor from _parse_sql_cached, so
+            callers that already parsed the SQL don't pay a second lookup
 
     Returns:
-        Prepared parameters array
+        Tuple of (executable SQL, prepared parameters array)
 
     Raises:
         ValueError: If parameter style doesn't match
     """
-    style, _, _ = detect_param_style(sql)
+    info = style_info or _parse_sql_cached(sql)
+    style = info.style
 
     if style == "named":
         if not isinstance(params, dict):
             raise ValueError(
                 "Named parameters require a dict, e.g., {'id': 1, 'name': 'test'}"
             )
-        return parse_named_params(sql, params)
+        return (info.rewritten_sql, _named_values(info.order, params))
 
     if style == "positional":
         if not isinstance(params, list):
             raise ValueError("Positional parameters require a list, e.g., [1, 'test']")
-        return [_to_pg_value(p) for p in params]
+        # Scalar-only lists (the common case) skip conversion entirely
+        if all(type(p) in _SCALAR_TYPES for p in params):
+            return (sql, params)
+        return (sql, [_to_pg_value(p) for p in params])
 
     # No parameters
-    return []
+    return (sql, [])
+
+
+def prepare_params_positional(params: Any) -> List[Any]:
+    """
+    Fast path for callers that already know their SQL is positional
+
+    Skips style detection entirely - no regex, no cache lookup. Used by
+    the executor when a param_style='positional' hint is given (e.g. by
+    generated code).
+
+    Args:
+        params: Positional parameter list
+
+    Returns:
+        Prepared parameters array
+
+    Raises:
+        ValueError: If params is not a list
+    """
+    if not isinstance(params, list):
+        raise ValueError("Positional parameters require a list, e.g., [1, 'test']")
+    if all(type(p) in _SCALAR_TYPES for p in params):
+        return params
+    return [_to_pg_value(p) for p in params]
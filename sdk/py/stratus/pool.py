@@ -5,16 +5,21 @@ Supports both asyncpg (preferred) and psycopg2.
 """
 
 import asyncio
-from typing import Optional, Dict, Any, AnyStr
+import sys
+import weakref
+from typing import AsyncIterator, Mapping, Optional, Dict, Any, List, Sequence, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
 try:
     import asyncpg
+    from asyncpg.exceptions import InvalidCachedStatementError
 
     ASYNCPG_AVAILABLE = True
 except ImportError:
     ASYNCPG_AVAILABLE = False
+    InvalidCachedStatementError = ()  # type: ignore[assignment]
 
 try:
     import psycopg
@@ -24,10 +29,10 @@ try:
 except ImportError:
     PSYCOPG_AVAILABLE = False
 
-from .types import StratusConfig, QueryResult
+from .types import _SLOTS, StratusConfig, QueryResult
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PoolStats:
     """Pool statistics"""
 
@@ -115,16 +120,29 @@ class StratusPool:
         """Get the driver being used"""
         return self._driver if hasattr(self, "_driver") else "unknown"
 
-    async def connect(self) -> "PoolConnection":
-        """Get a connection from the pool"""
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator["PoolConnection"]:
+        """
+        Acquire a connection from the pool for the duration of the block
+
+        The connection is released back to the pool on exit - never
+        closed, so the TCP/SSL session and its prepared statements are
+        reused by the next acquire.
+        """
         await self._init_async_pool()
 
         if self._driver == "asyncpg" and ASYNCPG_AVAILABLE:
             conn = await self._pool.acquire()
-            return AsyncPGConnection(conn)
+            try:
+                yield AsyncPGConnection(conn)
+            finally:
+                await self._pool.release(conn)
         else:
             conn = self._pool.getconn()
-            return PsycopgConnection(conn)
+            try:
+                yield PsycopgConnection(conn)
+            finally:
+                self._pool.putconn(conn)
 
     async def execute(
         self, sql: str, params: Optional[List[Any]] = None
@@ -174,16 +192,15 @@ class StratusPool:
 
 
 class PoolConnection:
-    """Abstract connection interface"""
-
-    async def __aenter__(self) -> "PoolConnection":
-        return self
+    """Abstract connection interface
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        await self.close()
+    Lifetime is managed by ``StratusPool.connect()``, which releases the
+    underlying connection back to the pool; the wrapper itself is not a
+    context manager, so a pooled connection cannot be closed by accident.
+    """
 
     async def execute(
-        self, sql: str, params: Optional[List[Any]] = None
+        self, sql: str, params: Optional[List[Any]] = None, *, return_type: str = "many"
     ) -> QueryResult:
         raise NotImplementedError
 
@@ -197,6 +214,24 @@ class PoolConnection:
     ) -> Dict[str, Any]:
         raise NotImplementedError
 
+    async def execute_many(self, sql: str, params_list: List[List[Any]]) -> None:
+        raise NotImplementedError
+
+    async def fetchmany(
+        self, sql: str, params_list: List[List[Any]]
+    ) -> Sequence[Mapping[str, Any]]:
+        raise NotImplementedError
+
+    def transaction(
+        self,
+        *,
+        isolation: Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> Any:
+        """Return a driver-native transaction object, if the driver has one"""
+        raise NotImplementedError
+
     async def close(self) -> None:
         raise NotImplementedError
 
@@ -214,18 +249,171 @@ class PoolConnection:
         raise NotImplementedError
 
 
+# Prepared statements are cached per raw asyncpg connection so they
+# survive pool checkout/return (the wrapper below is recreated on every
+# acquire). WeakKeyDictionary drops the cache when the connection dies.
+_PS_CACHE_MAX = 256
+_ps_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# Transaction-control statements cannot be prepared
+_NO_PREPARE = frozenset({"BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE"})
+
+
+class _RecordProxy:
+    """
+    Lazy mapping view over an asyncpg Record
+
+    Records already expose the mapping protocol; this thin wrapper makes
+    them behave like plain dicts (key iteration, ``in``, ``.get()``)
+    without converting each row - no per-column hashing or dict
+    allocation until a caller actually reads a value.
+    """
+
+    __slots__ = ("_record",)
+
+    def __init__(self, record: Any):
+        self._record = record
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._record[key]
+
+    def __iter__(self) -> Any:
+        return iter(self._record.keys())
+
+    def __len__(self) -> int:
+        return len(self._record)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._record
+
+    def __repr__(self) -> str:
+        return repr(dict(self._record))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._record.get(key, default)
+
+    def keys(self) -> Any:
+        return self._record.keys()
+
+    def values(self) -> Any:
+        return self._record.values()
+
+    def items(self) -> Any:
+        return self._record.items()
+
+
+class _RecordRows:
+    """
+    Lazy sequence of _RecordProxy views over a fetched record list
+
+    Wrapping the driver's record list directly means a query result costs
+    one extra allocation (this object) rather than a second full list of
+    per-row wrappers; proxies are created on access.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Any):
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [_RecordProxy(r) for r in self._records[index]]
+        return _RecordProxy(self._records[index])
+
+    def __iter__(self) -> Any:
+        for record in self._records:
+            yield _RecordProxy(record)
+
+    def __repr__(self) -> str:
+        return repr([dict(r) for r in self._records])
+
+
+def _parse_status(status: str) -> Tuple[str, int]:
+    """Parse an asyncpg command status like 'INSERT 0 5' into (command, row_count)"""
+    parts = status.split()
+    command = parts[0] if parts else ""
+    row_count = int(parts[-1]) if parts and parts[-1].isdigit() else 0
+    return (command, row_count)
+
+
+def _is_preparable(sql: str) -> bool:
+    """Check whether a statement can go through the prepared-statement cache"""
+    first_word = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+    return first_word not in _NO_PREPARE
+
+
 class AsyncPGConnection(PoolConnection):
     """asyncpg connection wrapper"""
 
     def __init__(self, conn: asyncpg.Connection):
         self._conn = conn
+        # Pool.acquire() hands out a fresh PoolConnectionProxy on every
+        # checkout; that proxy is slotted without __weakref__ and is a
+        # different object each time. Key the cache on the underlying
+        # Connection instead, which is weak-referenceable and stable
+        # across checkout/return.
+        raw = getattr(conn, "_con", conn)
+        cache = _ps_caches.get(raw)
+        if cache is None:
+            cache = _ps_caches[raw] = OrderedDict()
+        self._ps_cache: "OrderedDict[str, Any]" = cache
+
+    async def _get_stmt(self, sql: str, *, refresh: bool = False) -> Any:
+        """Look up (or prepare and cache) a statement, with LRU eviction"""
+        cache = self._ps_cache
+        if refresh:
+            cache.pop(sql, None)
+        stmt = cache.get(sql)
+        if stmt is None:
+            stmt = await self._conn.prepare(sql)
+            cache[sql] = stmt
+            if len(cache) > _PS_CACHE_MAX:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(sql)
+        return stmt
+
+    async def _run_stmt(self, sql: str, call: Any) -> Any:
+        """Run an operation against the cached statement for this SQL
+
+        DDL can invalidate a long-lived prepared statement server-side;
+        asyncpg surfaces that as InvalidCachedStatementError. Re-prepare
+        once and retry, matching the retry asyncpg's own statement cache
+        performs internally. Inside an open transaction the transaction
+        is already aborted, so a retry would only mask the root cause
+        with InFailedSQLTransactionError - re-raise instead, as asyncpg
+        does.
+        """
+        stmt = await self._get_stmt(sql)
+        try:
+            return await call(stmt)
+        except InvalidCachedStatementError:
+            if self._conn.is_in_transaction():
+                raise
+            stmt = await self._get_stmt(sql, refresh=True)
+            return await call(stmt)
 
     async def execute(
-        self, sql: str, params: Optional[List[Any]] = None
+        self, sql: str, params: Optional[List[Any]] = None, *, return_type: str = "many"
     ) -> QueryResult:
-        result = await self._conn.fetch(sql, params)
+        if return_type == "exec" or not _is_preparable(sql):
+            # No rows wanted (or statement cannot be prepared): execute
+            # without fetching, using the status line for the row count.
+            status = await self._conn.execute(sql, *(params or ()))
+            command, row_count = _parse_status(status)
+            return QueryResult(rows=[], row_count=row_count, command=command)
+
+        args = params or ()
+        result = await self._run_stmt(sql, lambda stmt: stmt.fetch(*args))
         return QueryResult(
-            rows=[dict(r) for r in result],
+            rows=_RecordRows(result),
             row_count=len(result),
             command="SELECT",
         )
@@ -233,15 +421,47 @@ class AsyncPGConnection(PoolConnection):
     async def fetch(
         self, sql: str, params: Optional[List[Any]] = None
     ) -> List[Dict[str, Any]]:
-        result = await self._conn.fetch(sql, params)
-        return [dict(r) for r in result]
+        args = params or ()
+        result = await self._run_stmt(sql, lambda stmt: stmt.fetch(*args))
+        if not result:
+            return []
+        # Interned column names are shared across every row dict (and
+        # across results), instead of N copies of the same key strings
+        columns = tuple(sys.intern(k) for k in result[0].keys())
+        return [dict(zip(columns, r.values())) for r in result]
 
     async def fetchrow(
         self, sql: str, params: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
-        row = await self._conn.fetchrow(sql, params)
+        args = params or ()
+        row = await self._run_stmt(sql, lambda stmt: stmt.fetchrow(*args))
         return dict(row) if row else {}
 
+    async def execute_many(self, sql: str, params_list: List[List[Any]]) -> None:
+        # executemany sends all parameter sets in one batch (single
+        # implicit transaction, one round-trip amortized over the batch)
+        await self._conn.executemany(sql, params_list)
+
+    async def fetchmany(
+        self, sql: str, params_list: List[List[Any]]
+    ) -> Sequence[Mapping[str, Any]]:
+        # Rows are lazy Record proxies, like QueryResult.rows
+        result = await self._run_stmt(sql, lambda stmt: stmt.fetchmany(params_list))
+        return [_RecordProxy(r) for r in result]
+
+    def transaction(
+        self,
+        *,
+        isolation: Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> Any:
+        return self._conn.transaction(
+            isolation=isolation,
+            readonly=readonly,
+            deferrable=deferrable,
+        )
+
     async def close(self) -> None:
         await self._conn.close()
 
@@ -252,11 +472,20 @@ class PsycopgConnection(PoolConnection):
     def __init__(self, conn):
         self._conn = conn
 
-    def execute(self, sql: str, params: Optional[List[Any]] = None) -> QueryResult:
+    def execute(
+        self, sql: str, params: Optional[List[Any]] = None, *, return_type: str = "many"
+    ) -> QueryResult:
         with self._conn.cursor() as cur:
             cur.execute(sql, params)
+            if return_type == "exec" or cur.description is None:
+                return QueryResult(
+                    rows=[],
+                    row_count=cur.rowcount,
+                    command=cur.statusmessage or "",
+                )
             result = cur.fetchall()
-            columns = [desc[0] for desc in cur.description] if cur.description else []
+            # Interned column names are shared across every row dict
+            columns = tuple(sys.intern(desc[0]) for desc in cur.description)
             rows = [dict(zip(columns, r)) for r in result]
             return QueryResult(
                 rows=rows,
@@ -270,7 +499,11 @@ class PsycopgConnection(PoolConnection):
         with self._conn.cursor() as cur:
             cur.execute(sql, params)
             result = cur.fetchall()
-            columns = [desc[0] for desc in cur.description] if cur.description else []
+            columns = (
+                tuple(sys.intern(desc[0]) for desc in cur.description)
+                if cur.description
+                else ()
+            )
             return [dict(zip(columns, r)) for r in result]
 
     def fetchrow(self, sql: str, params: Optional[List[Any]] = None) -> Dict[str, Any]:
@@ -282,6 +515,10 @@ class PsycopgConnection(PoolConnection):
                 return dict(zip(columns, row))
             return {}
 
+    def execute_many(self, sql: str, params_list: List[List[Any]]) -> None:
+        with self._conn.cursor() as cur:
+            cur.executemany(sql, params_list)
+
     def close(self) -> None:
         self._conn.close()
 
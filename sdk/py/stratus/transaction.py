@@ -2,32 +2,62 @@
 Transaction support
 """
 
-from typing import TypeVar, Generic, Callable, Awaitable, Optional
+from functools import lru_cache
+from typing import Any, TypeVar, Generic, Callable, Awaitable, Optional
 from dataclasses import dataclass
 
 from .pool import StratusPool, PoolConnection
-from .executor import StratusExecutor
-from .types import TransactionOptions, QueryResult
+from .types import TransactionOptions, IsolationLevel, QueryResult
 
 
 T = TypeVar("T")
 
 TransactionScope = Callable[["StratusTransaction"], Awaitable[T]]
 
+# asyncpg spells isolation levels with underscores
+_ASYNCPG_ISOLATION = {
+    IsolationLevel.READ_UNCOMMITTED: "read_uncommitted",
+    IsolationLevel.READ_COMMITTED: "read_committed",
+    IsolationLevel.REPEATABLE_READ: "repeatable_read",
+    IsolationLevel.SERIALIZABLE: "serializable",
+}
+
+# Fixed transaction-control statements, as constants so every
+# transaction sends the identical string objects (stable SQL text)
+_BEGIN_SQL = "BEGIN"
+_COMMIT_SQL = "COMMIT"
+_ROLLBACK_SQL = "ROLLBACK"
+
+
+@lru_cache(maxsize=None)
+def _begin_statement(
+    isolation_level: Optional[IsolationLevel],
+    read_only: bool,
+    deferrable: bool,
+) -> str:
+    """Build (once per option combination) the BEGIN statement text"""
+    parts = [_BEGIN_SQL]
+    if isolation_level:
+        parts.append(f"ISOLATION LEVEL {isolation_level.value}")
+    if read_only:
+        parts.append("READ ONLY")
+    if deferrable:
+        parts.append("DEFERRABLE")
+    return " ".join(parts)
+
 
 class StratusTransaction:
     """
     Transaction context
 
-    Provides transaction-aware query execution.
+    Provides transaction-aware query execution. When the driver exposes a
+    native transaction object (asyncpg), commit/rollback go through it;
+    otherwise they fall back to explicit COMMIT/ROLLBACK statements.
     """
 
-    def __init__(self, connection: PoolConnection):
+    def __init__(self, connection: PoolConnection, tx: Optional[Any] = None):
         self._connection = connection
-        self._executor = StratusExecutor(
-            # Create a dummy pool - we'll use the connection directly
-            __import__("stratus").pool.StratusPool("")
-        )
+        self._tx = tx
         self._committed = False
         self._rolled_back = False
 
@@ -47,14 +77,20 @@ class StratusTransaction:
         """Commit transaction"""
         if self._committed or self._rolled_back:
             raise RuntimeError("Transaction already finished")
-        await self._connection.execute("COMMIT")
+        if self._tx is not None:
+            await self._tx.commit()
+        else:
+            await self._connection.execute(_COMMIT_SQL)
         self._committed = True
 
     async def rollback(self) -> None:
         """Rollback transaction"""
         if self._committed:
             return
-        await self._connection.execute("ROLLBACK")
+        if self._tx is not None:
+            await self._tx.rollback()
+        else:
+            await self._connection.execute(_ROLLBACK_SQL)
         self._rolled_back = True
 
     @property
@@ -104,34 +140,62 @@ async def with_transaction(
         ```
     """
     async with pool.connect() as connection:
+        # Prefer the driver-native transaction object: asyncpg starts the
+        # transaction as part of the first statement batch and skips the
+        # SQL parser for the fixed BEGIN/COMMIT/ROLLBACK commands.
         try:
-            # Set isolation level if specified
-            if options and options.isolation_level:
+            tx = connection.transaction(
+                isolation=(
+                    _ASYNCPG_ISOLATION[options.isolation_level]
+                    if options and options.isolation_level
+                    else None
+                ),
+                readonly=options.read_only if options else False,
+                deferrable=options.deferrable if options else False,
+            )
+        except NotImplementedError:
+            tx = None
+
+        trx: Optional[StratusTransaction] = None
+        try:
+            if tx is not None:
+                await tx.start()
+            else:
+                # Fallback for drivers without a native transaction
+                # object: Postgres accepts the options inline on BEGIN,
+                # so the whole setup is one statement instead of a
+                # separate SET round-trip. The statement text is built
+                # once per option combination and reused.
                 await connection.execute(
-                    f"SET TRANSACTION ISOLATION LEVEL {options.isolation_level.value}"
+                    _begin_statement(
+                        options.isolation_level if options else None,
+                        options.read_only if options else False,
+                        options.deferrable if options else False,
+                    )
                 )
 
-            # Start transaction
-            await connection.execute("BEGIN")
-
             # Create transaction context
-            trx = StratusTransaction(connection)
+            trx = StratusTransaction(connection, tx)
 
             # Execute scope
             result = await scope(trx)
 
-            # Commit if not already rolled back
-            if not trx.rolled_back:
+            # Commit if not already finished
+            if not trx.rolled_back and not trx.committed:
                 await trx.commit()
 
             return result
         except Exception as error:
-            # Rollback on any error
-            try:
-                await connection.execute("ROLLBACK")
-            except Exception as rollback_error:
-                # Log but don't throw - original error is more important
-                print(f"Rollback failed: {rollback_error}")
+            # Rollback on any error, unless the scope already finished it
+            if trx is None or not (trx.rolled_back or trx.committed):
+                try:
+                    if tx is not None:
+                        await tx.rollback()
+                    else:
+                        await connection.execute(_ROLLBACK_SQL)
+                except Exception as rollback_error:
+                    # Log but don't throw - original error is more important
+                    print(f"Rollback failed: {rollback_error}")
             raise error
 
 
@@ -2,10 +2,15 @@
 Type definitions for Stratus Python SDK
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Any, List, Optional, Dict, Union, Literal
+from typing import Any, List, Mapping, Optional, Dict, Sequence, Union, Literal
 from enum import Enum
 
+# slots=True keeps per-instance overhead down on the hot result types;
+# it needs Python 3.10, so 3.9 falls back to plain dataclasses.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class StratusConfig:
@@ -43,20 +48,24 @@ class TransactionOptions:
     deferrable: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class QueryResult:
-    """Query result container"""
+    """Query result container
 
-    rows: List[Dict[str, Any]]
+    ``rows`` holds mapping views over driver records; they behave like
+    dicts (``row["col"]``, ``row.keys()``) without eager conversion.
+    """
+
+    rows: Sequence[Mapping[str, Any]]
     row_count: int
     command: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SingleResult:
     """Single row result (for :one queries)"""
 
-    row: Optional[Dict[str, Any]]
+    row: Optional[Mapping[str, Any]]
     found: bool
 
 
@@ -0,0 +1,85 @@
+"""
+Tests for the asyncpg connection wrapper
+
+The pool hands AsyncPGConnection an asyncpg PoolConnectionProxy, not a
+raw Connection; these tests pin the wrapper behaviors that depend on
+that (proxy is slotted without __weakref__ and is recreated per
+acquire).
+"""
+
+import pytest
+from asyncpg.exceptions import InvalidCachedStatementError
+from asyncpg.pool import PoolConnectionProxy
+
+from stratus.pool import AsyncPGConnection
+
+
+class FakeStatement:
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.fail_times = 0
+
+    async def fetch(self, *args):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise InvalidCachedStatementError("cached statement plan is invalid")
+        return []
+
+
+class FakeConnection:
+    def __init__(self):
+        self.prepared = []
+        self.in_transaction = False
+
+    async def prepare(self, sql: str) -> FakeStatement:
+        self.prepared.append(sql)
+        return FakeStatement(sql)
+
+    def is_in_transaction(self) -> bool:
+        return self.in_transaction
+
+
+def _proxied(raw: FakeConnection) -> PoolConnectionProxy:
+    """Build a PoolConnectionProxy around a connection, as Pool.acquire does"""
+    proxy = PoolConnectionProxy.__new__(PoolConnectionProxy)
+    proxy._con = raw
+    return proxy
+
+
+async def test_wraps_pool_proxy_and_caches_on_underlying_connection():
+    # Pool.acquire() returns a PoolConnectionProxy (no __weakref__ slot);
+    # constructing the wrapper around it must not raise
+    raw = FakeConnection()
+    conn = AsyncPGConnection(_proxied(raw))
+    await conn.fetch("SELECT 1")
+    await conn.fetch("SELECT 1")
+    assert raw.prepared == ["SELECT 1"]
+
+    # A new proxy per checkout must still hit the same statement cache
+    conn2 = AsyncPGConnection(_proxied(raw))
+    await conn2.fetch("SELECT 1")
+    assert raw.prepared == ["SELECT 1"]
+
+
+async def test_invalidated_statement_is_reprepared_and_retried():
+    # DDL invalidates long-lived prepared statements server-side; the
+    # wrapper re-prepares once and retries instead of surfacing the error
+    raw = FakeConnection()
+    conn = AsyncPGConnection(_proxied(raw))
+    await conn.fetch("SELECT * FROM t")
+    conn._ps_cache["SELECT * FROM t"].fail_times = 1
+    assert await conn.fetch("SELECT * FROM t") == []
+    assert raw.prepared == ["SELECT * FROM t", "SELECT * FROM t"]
+
+
+async def test_invalidated_statement_reraises_inside_transaction():
+    # An aborted transaction cannot re-prepare; retrying would replace
+    # the root-cause error with InFailedSQLTransactionError
+    raw = FakeConnection()
+    conn = AsyncPGConnection(_proxied(raw))
+    await conn.fetch("SELECT * FROM t")
+    raw.in_transaction = True
+    conn._ps_cache["SELECT * FROM t"].fail_times = 1
+    with pytest.raises(InvalidCachedStatementError):
+        await conn.fetch("SELECT * FROM t")
+    assert raw.prepared == ["SELECT * FROM t"]